@@ -3,14 +3,12 @@ Dispersive elements used to separate light into its constituent wavelengths
 (or frequencies, or energies) for recording a spectrum.
 """
 import astropy.units as u
-from astropy.units import (UnitConversionError, UnitsError, quantity_input,
-                           Quantity)
-from spectroscopyx.constants import (m_p, m_e, c, mu0, k_B, e, eps0, pi)
+from astropy.units import Quantity
 import numpy as np
 
 
 def bragg_angle(d_lattice, wavelength, order=1):
-    r"""Calculate the thermal deBroglie wavelength for electrons.
+    r"""Calculate the Bragg angle for diffraction of a photon by a crystal.
 
     Parameters
     ----------
@@ -18,7 +16,8 @@ def bragg_angle(d_lattice, wavelength, order=1):
         Interlattice spacing of the Bragg diffraction crystal.
 
     wavelength: Quantity
-        Wavelength of photon being diffracted.
+        Wavelength of photon being diffracted. May be an array, in which
+        case the Bragg angle is returned for each wavelength.
 
     order: Quantity, int
         Diffraction order. Defaults to first order diffraction
@@ -31,16 +30,11 @@ def bragg_angle(d_lattice, wavelength, order=1):
     Raises
     ------
     TypeError
-        If argument is not a Quantity
+        If d_lattice or wavelength is not a Quantity
 
     UnitConversionError
-        If argument is in incorrect units
-
-    ValueError
-        If argument contains invalid values
-
-    UserWarning
-        If units are not provided and SI units are assumed
+        If d_lattice cannot be converted to the units of wavelength, or
+        order is a Quantity that is not dimensionless
 
     Notes
     -----
@@ -50,6 +44,10 @@ def bragg_angle(d_lattice, wavelength, order=1):
     .. math::
     n\lambda = 2 d \sin(\theta)
 
+    The arguments are broadcast against each other following the usual
+    NumPy rules, so the angles for a whole spectrum may be computed in a
+    single call.
+
     See also
     --------
 
@@ -64,5 +62,13 @@ def bragg_angle(d_lattice, wavelength, order=1):
 
 
     """
-    theta = np.arcsin(order * wavelength / (2 * d_lattice))
-    return theta.to(u.rad)
+    if not isinstance(d_lattice, Quantity):
+        raise TypeError("d_lattice must be a Quantity with units of length.")
+    if not isinstance(wavelength, Quantity):
+        raise TypeError("wavelength must be a Quantity with units of length.")
+    if isinstance(order, Quantity):
+        order = order.to_value(u.dimensionless_unscaled)
+
+    factor = order / (2 * d_lattice.to_value(wavelength.unit))
+    sin_theta = factor * wavelength.value
+    return np.arcsin(sin_theta) * u.rad
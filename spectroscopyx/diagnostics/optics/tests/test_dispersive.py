@@ -32,3 +32,48 @@ class Test_bragg_angle(object):
                           angleTrue.value,
                           rtol=1e-8,
                           atol=0.0), errStr
+
+    @pytest.mark.parametrize("d_lattice, wavelength, order", [
+        (0.6708 / 2 * u.nm, np.array([0.5, 1.0, 1.5]) * u.angstrom, 1),
+        (np.array([0.3, 0.4]) * u.nm, 4.188655 * u.angstrom, 1),
+        (1 * u.nm, 4.188655 * u.angstrom, np.array([1, 2, 3])),
+        (1 * u.nm, np.array([0.1, 0.2, 0.3]) * u.nm, np.array([[1], [2]])),
+    ])
+    def test_broadcast(self, d_lattice, wavelength, order):
+        """
+        Checks that array arguments are broadcast against each other and
+        that each element satisfies n * lambda = 2 * d * sin(theta).
+        """
+        angles = bragg_angle(d_lattice=d_lattice,
+                             wavelength=wavelength,
+                             order=order)
+        sinTrue = (order * wavelength /
+                   (2 * d_lattice)).to_value(u.dimensionless_unscaled)
+        anglesTrue = np.arcsin(sinTrue)
+        errStr = (f"Bragg angles should be {anglesTrue} rad "
+                  f"and not {angles}.")
+        assert angles.unit == u.rad
+        assert angles.shape == np.broadcast(d_lattice, wavelength,
+                                            order).shape
+        assert np.allclose(angles.value,
+                           anglesTrue,
+                           rtol=1e-8,
+                           atol=0.0), errStr
+
+    def test_float_wavelength(self):
+        """
+        Checks that a wavelength without units raises a TypeError.
+        """
+        with pytest.raises(TypeError):
+            bragg_angle(d_lattice=self.d_lattice,
+                        wavelength=self.wavelength.value,
+                        order=1)
+
+    def test_float_d_lattice(self):
+        """
+        Checks that a lattice spacing without units raises a TypeError.
+        """
+        with pytest.raises(TypeError):
+            bragg_angle(d_lattice=self.d_lattice.value,
+                        wavelength=self.wavelength,
+                        order=1)